@@ -4,19 +4,79 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
-from bs4 import BeautifulSoup
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
+import requests
+from collections import defaultdict
+from contextlib import closing
+from io import StringIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
+import queue
 import re
+import sqlite3
+import threading
 import time
 import os
 
 
+# Number of pages (and headless browsers) processed concurrently
+MAX_THREADS = 4
+
+# Worker processes parsing downloaded pages; leaves a core for the fetchers
+PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Single SQLite database (inside the results folder) holding every table
+DB_FILENAME = "tables.db"
+
+# Seconds a writer waits for another process to release the database
+SQLITE_TIMEOUT = 30
+
+# Seconds DriverPool.acquire() waits for a free browser before giving up
+DRIVER_ACQUIRE_TIMEOUT = 120
+
+# Seconds to wait for a page download or driver.get() before giving up
+PAGE_LOAD_TIMEOUT = 15
+
+# HTTP connections each WebDriver client may keep open to chromedriver
+CONNECTION_POOL_MAXSIZE = 20
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Resources the scraper never reads; blocked to cut page-load bytes
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*googlesyndication*",
+]
+
+# Only <table> subtrees are built when parsing a page
+_ONLY_TABLES = SoupStrainer("table")
+
+# Filename sanitisers for table captions and ids
+_CAPTION_STRIP = re.compile(r"[^\w\s-]")
+_CAPTION_SPACE = re.compile(r"[-\s]+")
+_ID_STRIP = re.compile(r"[^\w\-]")
+_ID_MULTI = re.compile(r"_+")
+
+# pandas' suffix for repeated single-row headers ("Gls", "Gls.1", ...)
+_PANDAS_DUPLICATE = re.compile(r"(.+)\.\d+")
+
+_thread_local = threading.local()
+_connection_pool_lock = threading.Lock()
+
+
 def ensure_results_folder():
     """Create results folder if it doesn't exist and return the path."""
     folder_path = "results"
-    if not os.path.exists(folder_path):
+    try:
         os.makedirs(folder_path)
+    except FileExistsError:
+        pass
+    else:
         print(f"📁 Created folder: {folder_path}")
     return folder_path
 
@@ -45,150 +105,451 @@ def handle_consent_popup(driver):
                     EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                 )
                 consent_button.click()
-                print("✅ Consent popup handled")
-                time.sleep(1)  # Brief pause after clicking
-                break
             except:
                 continue
+            
+            print("✅ Consent popup handled")
+            # Wait for the popup to go away rather than pausing blindly
+            try:
+                WebDriverWait(driver, 3).until(
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, selector))
+                )
+            except TimeoutException:
+                print("ℹ️ Consent popup still visible after clicking, continuing anyway")
+            break
     except Exception as e:
         print(f"ℹ️ No consent popup found or couldn't handle it: {str(e)}")
 
 
-def scrape_multiple_pages(base_url, pages, driver, base_filename="premier_league"):
-    """Scrape multiple pages with pagination."""
-    results_folder = ensure_results_folder()
+def wait_for_tables(driver, timeout=10):
+    """Block until a table with at least one visible body row is rendered."""
+    wait = WebDriverWait(driver, timeout)
+    wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+    wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
+
+
+def get_session():
+    """Return the calling thread's requests Session, creating it on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        _thread_local.session = session
+    return session
+
+
+def fetch_html(url):
+    """Download server-rendered HTML without a browser; None if it has no tables.
+    
+    The raw bytes are returned so the parser can honour the page's
+    <meta charset> (requests assumes ISO-8859-1 when the header omits it).
+    """
+    try:
+        response = get_session().get(url, timeout=PAGE_LOAD_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"ℹ️ Plain HTTP fetch failed for {url}: {str(e)}")
+        return None
+    
+    html = response.content
+    if b"<table" not in html:
+        return None
+    return html
+
+
+def navigate(driver, url):
+    """Navigate over CDP and wait until the previous document has been replaced."""
+    old_document = driver.find_element(By.TAG_NAME, "html")
+    result = driver.execute_cdp_cmd("Page.navigate", {"url": url})
+    if result.get("errorText"):
+        raise WebDriverException(f"Navigation to {url} failed: {result['errorText']}")
+    
+    # Page.navigate returns once the request is committed, so make sure the
+    # table waits below don't match the page we're leaving
+    WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(EC.staleness_of(old_document))
+
+
+def render_html(driver, url):
+    """Load url in the browser, wait for its tables and return the rendered HTML."""
+    navigate(driver, url)
+    
+    # Handle consent popup
+    handle_consent_popup(driver)
+    
+    # Wait for tables and their rows to load
+    wait_for_tables(driver)
+    return driver.page_source
+
+
+class DriverPool:
+    """Keep warmed-up Chrome drivers and hand them out to worker threads.
+    
+    Drivers are launched lazily (up to ``size``), reused between pages and
+    replaced when their session dies. Use as a context manager so every
+    browser is quit at the end::
+    
+        with DriverPool(size=4) as pool:
+            driver = pool.acquire()
+            ...
+            pool.release(driver)
+    """
+    
+    def __init__(self, size=MAX_THREADS, headless=True):
+        self.size = size
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._drivers = set()
+        self._launching = 0
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def acquire(self, timeout=DRIVER_ACQUIRE_TIMEOUT):
+        """Return a healthy driver, launching one if the pool isn't full yet.
+        
+        Raises TimeoutError if no driver becomes available within timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_launch = len(self._drivers) + self._launching < self.size
+                    if can_launch:
+                        # Reserve the slot so concurrent callers don't overshoot size
+                        self._launching += 1
+                if can_launch:
+                    return self._launch()
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No browser became available within {timeout}s")
+                try:
+                    # Time out now and then in case a retired driver freed a slot
+                    driver = self._idle.get(timeout=min(1, remaining))
+                except queue.Empty:
+                    continue
+            
+            if self._is_alive(driver):
+                return driver
+            print("♻️ Browser session lost, relaunching...")
+            self._retire(driver)
+    
+    def release(self, driver):
+        """Hand a driver back, clearing cookies so the next page starts fresh."""
+        try:
+            driver.delete_all_cookies()
+        except Exception:
+            # A dead chromedriver raises urllib3 errors, not WebDriverException
+            self._retire(driver)
+            return
+        self._idle.put(driver)
+    
+    def close(self):
+        """Quit every driver launched by this pool."""
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+                print("🔚 Browser closed.")
+            except Exception as e:
+                print(f"⚠️ Couldn't close browser cleanly: {str(e)}")
+    
+    def _launch(self):
+        print("🌐 Launching browser...")
+        driver = None
+        try:
+            driver = setup_driver(headless=self.headless)
+        finally:
+            with self._lock:
+                self._launching -= 1
+                if driver is not None:
+                    self._drivers.add(driver)
+        return driver
+    
+    def _retire(self, driver):
+        with self._lock:
+            self._drivers.discard(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _is_alive(driver):
+        if driver.session_id is None:
+            return False
+        try:
+            driver.current_url  # Cheap round-trip to check the session
+        except Exception:
+            return False
+        return True
+
+
+def _process_page(driver_pool, parse_pool, page_num, url, base_filename, db_path):
+    """Download a single page (falling back to a browser) and queue it for parsing.
+    
+    Returns the parse_pool future for the page's saved-table count, or None
+    if the page had no tables.
+    """
+    print(f"📄 Processing page {page_num}...")
+    html = fetch_html(url)
+    
+    if html is None:
+        print(f"🌐 Page {page_num} needs a browser, falling back to Selenium...")
+        driver = driver_pool.acquire()
+        try:
+            html = render_html(driver, url)
+        except TimeoutException:
+            print(f"⚠️ No tables found on page {page_num}")
+            return None
+        finally:
+            driver_pool.release(driver)
+    
+    # Parse in another process so this thread can fetch the next page.
+    # Tables get the page number in their filename.
+    return parse_pool.submit(
+        extract_and_save_tables,
+        html, 
+        f"{base_filename}_page_{page_num}",
+        db_path
+    )
+
+
+def scrape_multiple_pages(base_url, pages, base_filename="premier_league", max_workers=MAX_THREADS,
+                          driver_pool=None):
+    """Scrape multiple pages with pagination, loading several pages at once.
+    
+    Pass a DriverPool to reuse its browsers across calls; otherwise a pool
+    is created for this run and closed afterwards.
+    """
+    db_path = os.path.join(ensure_results_folder(), DB_FILENAME)
     all_tables_count = 0
     
+    urls = {}
     for page_num in pages:
-        print(f"📄 Processing page {page_num}...")
-        
         # Construct URL for the page - adjust this based on the site's URL structure
         if "?" in base_url:
-            url = f"{base_url}&page={page_num}"
+            urls[page_num] = f"{base_url}&page={page_num}"
         else:
-            url = f"{base_url}?page={page_num}"
-        
-        try:
-            driver.get(url)
-            time.sleep(2)  # Wait for page load
-            
-            # Handle consent popup on each page
-            handle_consent_popup(driver)
-            
-            # Wait for tables to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "table"))
-                )
-            except TimeoutException:
-                print(f"⚠️ No tables found on page {page_num}")
-                continue
-            
-            html = driver.page_source
-            soup = BeautifulSoup(html, "html.parser")
+            urls[page_num] = f"{base_url}?page={page_num}"
+    
+    own_pool = driver_pool is None
+    if own_pool:
+        driver_pool = DriverPool(size=max_workers)
+    
+    try:
+        # Workers start on demand from the fetch threads, so forking would
+        # copy locks held by other threads; spawn fresh interpreters instead
+        parse_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=parse_context) as parse_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _process_page, driver_pool, parse_pool, page_num, url, base_filename, db_path
+                ): page_num
+                for page_num, url in urls.items()
+            }
             
-            # Extract tables with page number in filename
-            page_tables = extract_and_save_tables(
-                soup, 
-                f"{base_filename}_page_{page_num}",
-                results_folder
-            )
-            all_tables_count += page_tables
+            parse_futures = {}
+            for future in as_completed(futures):
+                try:
+                    parse_future = future.result()
+                except Exception as e:
+                    print(f"❌ Error processing page {futures[future]}: {str(e)}")
+                    continue
+                if parse_future is not None:
+                    parse_futures[parse_future] = futures[future]
             
-        except Exception as e:
-            print(f"❌ Error processing page {page_num}: {str(e)}")
+            for future in as_completed(parse_futures):
+                try:
+                    all_tables_count += future.result()
+                except Exception as e:
+                    print(f"❌ Error processing page {parse_futures[future]}: {str(e)}")
+    finally:
+        if own_pool:
+            driver_pool.close()
     
     return all_tables_count
 
 
-def extract_and_save_tables(soup, base_filename, folder_path="results"):
-    """Extract tables from BeautifulSoup object and save as CSV files in specified folder."""
+def _quote_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column_names(headers):
+    """Return unique, non-empty column names based on headers."""
+    names = []
+    used = set()
+    seen_headers = set()
+    for i, header in enumerate(headers):
+        # Undo pandas' "Gls.1" renaming so all repeats are numbered "Gls_2"
+        match = _PANDAS_DUPLICATE.fullmatch(header)
+        if match and match.group(1) in seen_headers:
+            header = match.group(1)
+        seen_headers.add(header)
+        
+        base = header or f"column_{i + 1}"
+        name, n = base, 1
+        # SQLite column names are case-insensitive; grouped headers repeat
+        while name.lower() in used:
+            n += 1
+            name = f"{base}_{n}"
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+
+def _save_table(conn, table_name, headers, data):
+    """Create the new table table_name and bulk insert data into it.
+    
+    Both steps run inside a savepoint that is rolled back on failure, so a
+    table that fails to save leaves nothing behind. Returns the number of
+    columns written.
+    """
+    width = len(headers)
+    columns = ", ".join(_quote_identifier(name) for name in _column_names(headers))
+    
+    quoted_table = _quote_identifier(table_name)
+    conn.execute("SAVEPOINT save_table")
+    try:
+        conn.execute(f"CREATE TABLE {quoted_table} ({columns})")
+        conn.executemany(
+            f"INSERT INTO {quoted_table} VALUES ({', '.join('?' * width)})", data
+        )
+    except Exception:
+        conn.execute("ROLLBACK TO save_table")
+        raise
+    finally:
+        conn.execute("RELEASE save_table")
+    return width
+
+
+def extract_and_save_tables(html, base_filename, db_path=os.path.join("results", DB_FILENAME)):
+    """Extract tables from page HTML (str or bytes) and save each as a table in the SQLite database."""
+    soup = BeautifulSoup(html, "lxml", parse_only=_ONLY_TABLES)
     tables = soup.find_all("table")
     
     if not tables:
         print("⚠️ No tables found on the page.")
         return 0
 
-    saved_count = 0
-    
+    # Parse every table first so the database is only locked while writing
+    parsed = []
     for i, table in enumerate(tables):
         # Try to get table ID or generate descriptive one
         table_id = table.get("id") or table.get("class", [""])[0] or f"table_{i}"
         
-        # Extract table caption for better filename
+        # Extract table caption for a better table name
         caption = table.find("caption")
         if caption:
-            caption_text = re.sub(r"[^\w\s-]", "", caption.get_text().strip())
-            caption_text = re.sub(r"[-\s]+", "_", caption_text)
+            caption_text = _CAPTION_STRIP.sub("", caption.get_text().strip())
+            caption_text = _CAPTION_SPACE.sub("_", caption_text)
             if caption_text:
                 table_id = f"{caption_text}_{table_id}"
         
-        # Extract headers
-        headers = []
-        header_row = table.find("thead")
-        if header_row:
-            # Find all th elements, skip rows with specific classes if needed
-            headers = [th.get_text(strip=True) for th in header_row.find_all("th")]
-        
-        # If no headers in thead, check first row of tbody
-        if not headers:
-            first_row = table.find("tbody").find("tr") if table.find("tbody") else table.find("tr")
-            if first_row:
-                headers = [cell.get_text(strip=True) for cell in first_row.find_all(["th", "td"])]
+        # Let pandas parse the table with lxml; it handles colspan/rowspan.
+        # Without a <thead>, treat the first row as the header row.
+        try:
+            df = pd.read_html(
+                StringIO(str(table)),
+                flavor="lxml",
+                header=None if table.find("thead") else 0,
+            )[0]
+        except ValueError:
+            df = None
         
-        if not headers:
-            print(f"⚠️ Skipping table {table_id}: No headers found")
+        if df is None or df.empty:
+            print(f"⚠️ Skipping table {table_id}: No data rows found")
             continue
         
-        # Extract table data
-        data = []
-        tbody = table.find("tbody")
-        rows = tbody.find_all("tr") if tbody else table.find_all("tr")
+        # Keep only the bottom header row of grouped (multi-row) headers;
+        # pandas labels blank header cells "Unnamed: ..."
+        columns = df.columns
+        if isinstance(columns, pd.MultiIndex):
+            columns = columns.get_level_values(-1)
+        headers = ["" if str(c).startswith("Unnamed:") else str(c) for c in columns]
         
-        for row in rows:
-            # Skip header rows in tbody
-            if row.find_parent("thead"):
-                continue
-                
-            cells = row.find_all(["th", "td"])
-            row_data = [cell.get_text(strip=True) for cell in cells]
-            
-            # Only add rows that match header length (or handle mismatches)
-            if len(row_data) == len(headers) or len(row_data) > 0:
-                data.append(row_data)
+        # Convert to Python rows in one step; empty cells (NaN) become NULL
+        data = df.to_numpy(dtype=object, na_value=None).tolist()
+        
+        # Clean table name
+        safe_id = _ID_STRIP.sub("_", table_id.lower())
+        safe_id = _ID_MULTI.sub("_", safe_id).strip("_")
+        parsed.append((table_id, f"{base_filename}_{safe_id}", headers, data))
+    
+    saved_count = 0
+    name_counts = defaultdict(int)  # base name -> next suffix to try
+    
+    # One transaction per page. sqlite3 won't open one implicitly before DDL,
+    # so manage it explicitly; other processes writing the same database
+    # wait on SQLite's lock for up to SQLITE_TIMEOUT seconds
+    connection = sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT, isolation_level=None)
+    with closing(connection) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
         
-        # Create DataFrame and save
-        if data:
+        # Names taken by earlier runs plus this page's tables, read once under
+        # the write lock instead of probing per table. SQLite table names are
+        # case-insensitive.
+        existing = {
+            name.lower()
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        
+        for table_id, base_name, headers, data in parsed:
             try:
-                df = pd.DataFrame(data, columns=headers[:len(data[0])] if data else headers)
-                
-                # Clean filename
-                safe_id = re.sub(r"[^\w\-]", "_", table_id.lower())
-                safe_id = re.sub(r"_+", "_", safe_id).strip("_")
-                filename = f"{base_filename}_{safe_id}.csv"
-                file_path = os.path.join(folder_path, filename)
+                # Ensure unique table name so nothing is overwritten. Check every
+                # taken name, since "x" + suffix can equal another table's "x_1".
+                n = name_counts[base_name]
+                table_name = f"{base_name}_{n}" if n else base_name
+                while table_name.lower() in existing:
+                    n += 1
+                    table_name = f"{base_name}_{n}"
+                name_counts[base_name] = n + 1
+                existing.add(table_name.lower())
                 
-                # Ensure unique filename
-                counter = 1
-                original_file_path = file_path
-                while os.path.exists(file_path):
-                    name, ext = os.path.splitext(original_file_path)
-                    file_path = f"{name}_{counter}{ext}"
-                    counter += 1
-                
-                df.to_csv(file_path, index=False, encoding="utf-8-sig")
-                print(f"✅ Saved: {file_path} ({len(df)} rows, {len(df.columns)} columns)")
+                # Bulk insert rows into the database
+                columns = _save_table(conn, table_name, headers, data)
+                print(f"✅ Saved: {table_name} ({len(data)} rows, {columns} columns)")
                 saved_count += 1
                 
             except Exception as e:
                 print(f"❌ Error processing table {table_id}: {str(e)}")
-        else:
-            print(f"⚠️ Skipping table {table_id}: No data rows found")
     
     print(f"📊 Successfully saved {saved_count} out of {len(tables)} tables found.")
     return saved_count
 
 
+def enlarge_connection_pool(maxsize=CONNECTION_POOL_MAXSIZE):
+    """Raise the urllib3 pool size Selenium uses to talk to chromedriver.
+    
+    Selenium's default pool keeps a single connection, so commands issued
+    concurrently against a driver queue up and log "Connection pool is
+    full" warnings. Patching RemoteConnection once covers every driver.
+    """
+    with _connection_pool_lock:
+        original = RemoteConnection._get_connection_manager
+        if getattr(original, "pool_maxsize", None) == maxsize:
+            return
+        original = getattr(original, "__wrapped__", original)
+        
+        def _get_connection_manager(self):
+            manager = original(self)
+            manager.connection_pool_kw["maxsize"] = maxsize
+            return manager
+        
+        _get_connection_manager.__wrapped__ = original
+        _get_connection_manager.pool_maxsize = maxsize
+        RemoteConnection._get_connection_manager = _get_connection_manager
+
+
 def setup_driver(headless=True):
     """Set up and return Chrome WebDriver with common options."""
     options = Options()
@@ -200,47 +561,75 @@ def setup_driver(headless=True):
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1920,1080")
     
+    # Skip services the scraper never uses to speed up browser startup
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-translate")
+    options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees")
+    options.add_argument("--mute-audio")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    
     # Optional: Add user agent to avoid blocking
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    
+    # Return from driver.get() on DOMContentLoaded instead of waiting for
+    # every ad, font and tracker; tables are awaited explicitly.
+    options.page_load_strategy = "eager"
+    
+    # Don't download images; only the table HTML is needed
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+    
+    enlarge_connection_pool()
     
     service = Service()
     driver = webdriver.Chrome(service=service, options=options)
+    
+    # Block fonts, media and trackers at the network layer
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
+    # Pages are loaded with CDP Page.navigate (see navigate())
+    driver.execute_cdp_cmd("Page.enable", {})
+    
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.implicitly_wait(0)  # Explicit waits only
     return driver
 
 
 def main():
     base_url = "https://fbref.com/en/comps/9/Premier-League-Stats"
     
-    # Create results folder
+    # Create results folder; every table goes into one database inside it
     results_folder = ensure_results_folder()
+    db_path = os.path.join(results_folder, DB_FILENAME)
     
-    print("🌐 Launching browser...")
-    driver = setup_driver(headless=True)
+    # Browsers are only launched if a page needs one, then reused
+    driver_pool = DriverPool()
     
     try:
         # Option 1: Scrape single page
         print("🔗 Single page scraping mode...")
-        driver.get(base_url)
-        
-        # Handle consent popup
-        handle_consent_popup(driver)
-        
-        print("⏳ Waiting for page to load...")
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-        except TimeoutException:
-            print("⚠️ No tables found within timeout period, but continuing...")
-        
-        # Additional brief wait for JavaScript content
-        time.sleep(2)
+        html = fetch_html(base_url)
         
-        html = driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
+        # Only start Chrome if the plain HTTP response had no tables
+        if html is None:
+            driver = driver_pool.acquire()
+            try:
+                print("⏳ Waiting for page to load...")
+                html = render_html(driver, base_url)
+            except TimeoutException:
+                print("⚠️ No tables found within timeout period, but continuing...")
+                html = driver.page_source
+            finally:
+                driver_pool.release(driver)
         
-        # Extract and save tables to results folder
-        extract_and_save_tables(soup, "premier_league_stats", results_folder)
+        # Extract and save tables to the results database
+        extract_and_save_tables(html, "premier_league_stats", db_path)
         
         # Option 2: Uncomment to scrape multiple pages
         """
@@ -249,21 +638,20 @@ def main():
         total_tables = scrape_multiple_pages(
             base_url, 
             pages_to_scrape, 
-            driver, 
-            "premier_league_stats"
+            "premier_league_stats",
+            driver_pool=driver_pool
         )
         print(f"🏁 Scraping complete! Total tables saved: {total_tables}")
         """
         
         print("🏁 Scraping complete!")
-        print(f"📁 All results saved in: {os.path.abspath(results_folder)}")
+        print(f"📁 All results saved in: {os.path.abspath(db_path)}")
         
     except Exception as e:
         print(f"❌ An error occurred: {str(e)}")
         
     finally:
-        driver.quit()
-        print("🔚 Browser closed.")
+        driver_pool.close()
 
 
 if __name__ == "__main__":